@@ -1,25 +1,36 @@
+from __future__ import annotations
+
 import logging
 import os
 import re
-from functools import lru_cache
+from functools import cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Callable, Literal
 
 from dotenv import load_dotenv
 
-from .contracts_models import DeviceRouting
-from .ov_runtime import normalize_device
+if TYPE_CHECKING:
+    from .contracts_models import DeviceRouting
 
 # .env-Datei aus Projektroot laden (wenn vorhanden)
 _ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
-load_dotenv(dotenv_path=_ENV_PATH, override=False)
+if _ENV_PATH.is_file():
+    load_dotenv(dotenv_path=_ENV_PATH, override=False)
 
 logger = logging.getLogger("tvwallau-ai")
 
+_LIST_SPLIT_RE = re.compile(r"[|,]")
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_QUOTE_CHARS = ('"', "'")
+
+
+def _is_true(value: str | None) -> bool:
+    return (value or "").strip().lower() in _TRUTHY
+
 
 def _strip_optional_quotes(value: str) -> str:
     value = value.strip()
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+    if len(value) >= 2 and value[0] in _QUOTE_CHARS and value[-1] == value[0]:
         return value[1:-1].strip()
     return value
 
@@ -28,128 +39,221 @@ def _parse_stop_strings(value: str) -> tuple[str, ...]:
     if not value:
         return ()
     value = _strip_optional_quotes(value)
-    stop_strings: list[str] = []
-    for item in value.split("|"):
-        cleaned = _strip_optional_quotes(item)
-        if not cleaned:
-            continue
-        stop_strings.append(cleaned.replace("\\n", "\n"))
-    return tuple(stop_strings)
+    return tuple(
+        cleaned.replace("\\n", "\n")
+        for cleaned in map(_strip_optional_quotes, value.split("|"))
+        if cleaned
+    )
 
 
 def _parse_list(value: str) -> tuple[str, ...]:
     if not value:
         return ()
     value = _strip_optional_quotes(value)
-    items = re.split(r"[|,]", value)
-    cleaned = [_strip_optional_quotes(item).strip() for item in items]
-    return tuple([item for item in cleaned if item])
+    return tuple(
+        cleaned
+        for cleaned in map(_strip_optional_quotes, _LIST_SPLIT_RE.split(value))
+        if cleaned
+    )
+
+
+_FIELDS: tuple[tuple[str, object, Callable[[str], object]], ...] = (
+    # Server
+    ("AI_SERVICE_HOST", "0.0.0.0", str),
+    ("AI_SERVICE_PORT", 8000, int),
+    ("LOG_LEVEL", "info", str),
+    # AI pipeline
+    ("AI_DEVICE", "", str.strip),
+    ("ENABLE_CPU_FALLBACK", False, _is_true),
+    ("MODEL_DIR", "models", str.strip),
+    ("OFFLINE", True, _is_true),
+    ("MODEL_FETCH_MODE", "never", str.strip),
+    ("MODEL_FORCE_RESYNC_IN_PLACE", False, _is_true),
+    ("MODEL_PREPARE_WORKERS", 1, int),
+    ("MODEL_CONVERSION_TIMEOUT_SEC", 14400.0, float),
+    ("CLIP_SOURCE", "hf_export", str.strip),
+    ("CAPTION_HF_ID", "Salesforce/blip-image-captioning-base", str.strip),
+    ("LLM_SOURCE", "prebuilt_ov_ir", str.strip),
+    ("LLM_HF_ID", "Qwen/Qwen2.5-3B-Instruct", str.strip),
+    ("LLM_HF_OV_REPO", "llmware/qwen2.5-3b-instruct-ov", str.strip),
+    ("MAX_TAGS", 10, int),
+    ("MAX_CAPTIONS_PER_IMAGE", 1, int),
+    ("TAG_SHARED_MIN_RATIO", 0.6, float),
+    ("MAX_SOFT_TAGS", 12, int),
+    ("BRAND_STRICT", True, _is_true),
+    ("CAPTION_MAX_CHARS", 280, int),
+    ("CAPTION_CONSENSUS_TOPK", 8, int),
+    ("LLM_MAX_NEW_TOKENS", 220, int),
+    ("LLM_TEMPERATURE", 0.4, float),
+    ("LLM_PRELOAD_ON_STARTUP", False, _is_true),
+    ("REQUEST_TIMEOUT_SEC", 30.0, float),
+    ("LLM_TIMEOUT_SECONDS", 20.0, float),
+    ("DEBUG", False, _is_true),
+    ("DEBUG_AI", False, _is_true),
+    ("DEBUG_AI_INCLUDE_PROMPT", False, _is_true),
+    ("DEBUG_AI_LOG_RAW_TAIL", False, _is_true),
+    ("DEBUG_AI_MAX_TAGS_LOG", 50, int),
+    ("DEBUG_AI_MAX_CHARS", 6000, int),
+    ("DEBUG_AI_RESPONSE", True, _is_true),
+    ("DEVICES_CLIP", "openvino:GPU", str.strip),
+    ("DEVICES_BLIP", "openvino:GPU", str.strip),
+    ("DEVICES_LLM", "openvino:NPU", str.strip),
+    ("DEVICES_STRICT", True, _is_true),
+)
 
 
 class Settings:
+    __slots__ = (
+        "AI_SERVICE_HOST",
+        "AI_SERVICE_PORT",
+        "LOG_LEVEL",
+        "AI_DEVICE",
+        "ENABLE_CPU_FALLBACK",
+        "MODEL_DIR",
+        "MODEL_CACHE_DIR",
+        "OFFLINE",
+        "MODEL_FETCH_MODE",
+        "MODEL_FORCE_RESYNC_IN_PLACE",
+        "MODEL_PREPARE_WORKERS",
+        "MODEL_CONVERSION_TIMEOUT_SEC",
+        "OV_CACHE_DIR",
+        "OV_CLIP_DIR",
+        "OV_CAPTION_DIR",
+        "OV_LLM_DIR",
+        "CLIP_SOURCE",
+        "CAPTION_HF_ID",
+        "LLM_SOURCE",
+        "LLM_HF_ID",
+        "LLM_HF_OV_REPO",
+        "LLM_REVISION",
+        "MAX_TAGS",
+        "MAX_CAPTIONS_PER_IMAGE",
+        "TAG_SHARED_MIN_RATIO",
+        "MAX_SOFT_TAGS",
+        "BRAND_LIST_RAW",
+        "BRAND_LIST",
+        "BRAND_STRICT",
+        "CAPTION_MAX_CHARS",
+        "CAPTION_REPETITION_THRESHOLD",
+        "CAPTION_CONSENSUS_TOPK",
+        "LLM_MAX_NEW_TOKENS",
+        "LLM_TEMPERATURE",
+        "LLM_STOP_STRINGS_RAW",
+        "LLM_STOP_STRINGS",
+        "LLM_PRELOAD_ON_STARTUP",
+        "REQUEST_TIMEOUT_SEC",
+        "LLM_TIMEOUT_SECONDS",
+        "DEBUG",
+        "DEBUG_AI",
+        "DEBUG_AI_INCLUDE_PROMPT",
+        "DEBUG_AI_LOG_RAW_TAIL",
+        "DEBUG_AI_MAX_TAGS_LOG",
+        "DEBUG_AI_MAX_CHARS",
+        "DEBUG_AI_RESPONSE",
+        "DEVICES_CLIP",
+        "DEVICES_BLIP",
+        "DEVICES_LLM",
+        "DEVICES_STRICT",
+        "_device_routing",
+    )
+
     # Server
-    AI_SERVICE_HOST: str = os.getenv("AI_SERVICE_HOST", "0.0.0.0")
-    AI_SERVICE_PORT: int = int(os.getenv("AI_SERVICE_PORT", "8000"))
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "info")
+    AI_SERVICE_HOST: str
+    AI_SERVICE_PORT: int
+    LOG_LEVEL: str
 
     # AI pipeline
-    AI_DEVICE: str = os.getenv("AI_DEVICE", "").strip()
-    ENABLE_CPU_FALLBACK: bool = os.getenv("ENABLE_CPU_FALLBACK", "0").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
-    MODEL_DIR: str = os.getenv("MODEL_DIR", "models").strip()
-    MODEL_CACHE_DIR: str = os.getenv("MODEL_CACHE_DIR", MODEL_DIR).strip()
-    OFFLINE: bool = os.getenv("OFFLINE", "1").strip() in ("1", "true", "yes", "on")
-    MODEL_FETCH_MODE: str = os.getenv("MODEL_FETCH_MODE", "never").strip()
-    OV_CACHE_DIR: str = os.getenv("OV_CACHE_DIR", f"{MODEL_DIR}/.ov_cache").strip()
-
-    OV_CLIP_DIR: str = os.getenv("OV_CLIP_DIR", f"{MODEL_DIR}/clip").strip()
-    OV_CAPTION_DIR: str = os.getenv("OV_CAPTION_DIR", f"{MODEL_DIR}/caption").strip()
-    OV_LLM_DIR: str = os.getenv("OV_LLM_DIR", f"{MODEL_DIR}/llm").strip()
-    CLIP_SOURCE: str = os.getenv("CLIP_SOURCE", "hf_export").strip()
-    CAPTION_HF_ID: str = os.getenv(
-        "CAPTION_HF_ID", "Salesforce/blip-image-captioning-base"
-    ).strip()
-    LLM_SOURCE: Literal["prebuilt_ov_ir", "hf_export"] = os.getenv(
-        "LLM_SOURCE", "prebuilt_ov_ir"
-    ).strip()
-    LLM_HF_ID: str = os.getenv("LLM_HF_ID", "Qwen/Qwen2.5-3B-Instruct").strip()
-    LLM_HF_OV_REPO: str = os.getenv(
-        "LLM_HF_OV_REPO", "llmware/qwen2.5-3b-instruct-ov"
-    ).strip()
-    LLM_REVISION: str | None = os.getenv("LLM_REVISION") or None
-
-    MAX_TAGS: int = int(os.getenv("MAX_TAGS", "10"))
-    MAX_CAPTIONS_PER_IMAGE: int = int(os.getenv("MAX_CAPTIONS_PER_IMAGE", "1"))
-    TAG_SHARED_MIN_RATIO: float = float(os.getenv("TAG_SHARED_MIN_RATIO", "0.6"))
-    MAX_SOFT_TAGS: int = int(os.getenv("MAX_SOFT_TAGS", "12"))
-    BRAND_LIST_RAW: str = os.getenv("BRAND_LIST", "").strip()
-    BRAND_LIST: tuple[str, ...] = _parse_list(BRAND_LIST_RAW)
-    BRAND_STRICT: bool = os.getenv("BRAND_STRICT", "1").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
-    CAPTION_MAX_CHARS: int = int(os.getenv("CAPTION_MAX_CHARS", "280"))
-    CAPTION_REPETITION_THRESHOLD: int = int(
-        os.getenv("CAPTION_REPETITION_THRESHOLD")
-        or os.getenv("CAPTION_DEDUP_REPETITION_THRESHOLD", "3")
-    )
-    CAPTION_CONSENSUS_TOPK: int = int(
-        os.getenv("CAPTION_CONSENSUS_TOPK", "8")
-    )
+    AI_DEVICE: str
+    ENABLE_CPU_FALLBACK: bool
+    MODEL_DIR: str
+    MODEL_CACHE_DIR: str
+    OFFLINE: bool
+    MODEL_FETCH_MODE: str
+    MODEL_FORCE_RESYNC_IN_PLACE: bool
+    MODEL_PREPARE_WORKERS: int
+    MODEL_CONVERSION_TIMEOUT_SEC: float
+    OV_CACHE_DIR: str
 
-    LLM_MAX_NEW_TOKENS: int = int(os.getenv("LLM_MAX_NEW_TOKENS", "220"))
-    LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", "0.4"))
-    LLM_STOP_STRINGS_RAW: str | None = os.getenv("LLM_STOP_STRINGS")
-    LLM_STOP_STRINGS: tuple[str, ...] = _parse_stop_strings(
-        LLM_STOP_STRINGS_RAW or ""
-    )
-    LLM_PRELOAD_ON_STARTUP: bool = os.getenv(
-        "LLM_PRELOAD_ON_STARTUP", "0"
-    ).strip() in ("1", "true", "yes", "on")
-
-    REQUEST_TIMEOUT_SEC: float = float(os.getenv("REQUEST_TIMEOUT_SEC", "30"))
-    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "20"))
-    DEBUG: bool = os.getenv("DEBUG", "0").strip() in ("1", "true", "yes", "on")
-
-    DEBUG_AI: bool = os.getenv("DEBUG_AI", "0").strip() in ("1", "true", "yes", "on")
-    DEBUG_AI_INCLUDE_PROMPT: bool = os.getenv("DEBUG_AI_INCLUDE_PROMPT", "0").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
-    DEBUG_AI_LOG_RAW_TAIL: bool = os.getenv("DEBUG_AI_LOG_RAW_TAIL", "0").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
-    DEBUG_AI_MAX_TAGS_LOG: int = int(os.getenv("DEBUG_AI_MAX_TAGS_LOG", "50"))
-    DEBUG_AI_MAX_CHARS: int = int(os.getenv("DEBUG_AI_MAX_CHARS", "6000"))
-    DEBUG_AI_RESPONSE: bool = os.getenv("DEBUG_AI_RESPONSE", "1").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
+    OV_CLIP_DIR: str
+    OV_CAPTION_DIR: str
+    OV_LLM_DIR: str
+    CLIP_SOURCE: str
+    CAPTION_HF_ID: str
+    LLM_SOURCE: Literal["prebuilt_ov_ir", "hf_export"]
+    LLM_HF_ID: str
+    LLM_HF_OV_REPO: str
+    LLM_REVISION: str | None
 
-    DEVICES_CLIP: str = os.getenv("DEVICES_CLIP", "openvino:GPU").strip()
-    DEVICES_BLIP: str = os.getenv("DEVICES_BLIP", "openvino:GPU").strip()
-    DEVICES_LLM: str = os.getenv("DEVICES_LLM", "openvino:NPU").strip()
-    DEVICES_STRICT: bool = os.getenv("DEVICES_STRICT", "true").strip() in (
-        "1",
-        "true",
-        "yes",
-        "on",
-    )
+    MAX_TAGS: int
+    MAX_CAPTIONS_PER_IMAGE: int
+    TAG_SHARED_MIN_RATIO: float
+    MAX_SOFT_TAGS: int
+    BRAND_LIST_RAW: str
+    BRAND_LIST: tuple[str, ...]
+    BRAND_STRICT: bool
+    CAPTION_MAX_CHARS: int
+    CAPTION_REPETITION_THRESHOLD: int
+    CAPTION_CONSENSUS_TOPK: int
+
+    LLM_MAX_NEW_TOKENS: int
+    LLM_TEMPERATURE: float
+    LLM_STOP_STRINGS_RAW: str | None
+    LLM_STOP_STRINGS: tuple[str, ...]
+    LLM_PRELOAD_ON_STARTUP: bool
+
+    REQUEST_TIMEOUT_SEC: float
+    LLM_TIMEOUT_SECONDS: float
+    DEBUG: bool
+
+    DEBUG_AI: bool
+    DEBUG_AI_INCLUDE_PROMPT: bool
+    DEBUG_AI_LOG_RAW_TAIL: bool
+    DEBUG_AI_MAX_TAGS_LOG: int
+    DEBUG_AI_MAX_CHARS: int
+    DEBUG_AI_RESPONSE: bool
+
+    DEVICES_CLIP: str
+    DEVICES_BLIP: str
+    DEVICES_LLM: str
+    DEVICES_STRICT: bool
+
+    def __init__(self) -> None:
+        env = os.environ
+        env_get = env.get
+        for name, default, coerce in _FIELDS:
+            raw = env_get(name)
+            setattr(self, name, default if raw is None else coerce(raw))
+
+        # Fields whose defaults depend on other settings or on fallback keys.
+        model_dir = self.MODEL_DIR
+        self.MODEL_CACHE_DIR = env.get("MODEL_CACHE_DIR", model_dir).strip()
+        self.OV_CACHE_DIR = env.get("OV_CACHE_DIR", f"{model_dir}/.ov_cache").strip()
+        self.OV_CLIP_DIR = env.get("OV_CLIP_DIR", f"{model_dir}/clip").strip()
+        self.OV_CAPTION_DIR = env.get("OV_CAPTION_DIR", f"{model_dir}/caption").strip()
+        self.OV_LLM_DIR = env.get("OV_LLM_DIR", f"{model_dir}/llm").strip()
+        self.LLM_REVISION = env.get("LLM_REVISION") or None
+        self.BRAND_LIST_RAW = env.get("BRAND_LIST", "").strip()
+        self.BRAND_LIST = _parse_list(self.BRAND_LIST_RAW)
+        self.CAPTION_REPETITION_THRESHOLD = int(
+            env.get("CAPTION_REPETITION_THRESHOLD")
+            or env.get("CAPTION_DEDUP_REPETITION_THRESHOLD", "3")
+        )
+        self.LLM_STOP_STRINGS_RAW = env.get("LLM_STOP_STRINGS")
+        self.LLM_STOP_STRINGS = _parse_stop_strings(self.LLM_STOP_STRINGS_RAW or "")
+        self._device_routing: DeviceRouting | None = None
 
     def device_routing(self) -> DeviceRouting:
+        routing = self._device_routing
+        if routing is None:
+            routing = self._device_routing = self._build_device_routing()
+        return routing
+
+    def _build_device_routing(self) -> DeviceRouting:
+        # Imported lazily: ov_runtime pulls in openvino, which config does not
+        # need unless routing is actually requested.
+        from .contracts_models import DeviceRouting
+        from .ov_runtime import normalize_device
+
         devices_env = {
             "DEVICES_CLIP": os.getenv("DEVICES_CLIP"),
             "DEVICES_BLIP": os.getenv("DEVICES_BLIP"),
@@ -185,6 +289,6 @@ class Settings:
         )
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_settings() -> Settings:
     return Settings()
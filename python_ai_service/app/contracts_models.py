@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List, Literal, Optional
 
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+from typing_extensions import TypedDict
 
 LanguageCode = Literal["en"]
 ImageRefKind = Literal["path", "url", "base64"]
@@ -17,58 +20,74 @@ AiDevice = Literal[
 
 
 class ImageRef(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     kind: ImageRefKind
-    value: str
+    value: str = Field(..., max_length=8_000_000)
     mime: Optional[str] = None
     filename: Optional[str] = None
 
 
 class Money(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     amount: float = Field(..., gt=0)
     currency: Optional[str] = None
 
 
 class Tag(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     value: str
     score: Optional[float] = None
     source: Optional[str] = None
 
 
 class Caption(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
-    image_index: int = Field(..., alias="imageIndex")
+    image_index: int
     text: str
     source: Optional[str] = None
 
 
 class PipelineTimings(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
-    image_load_ms: float = Field(..., alias="imageLoadMs")
-    tagger_ms: float = Field(..., alias="taggerMs")
-    captioner_ms: float = Field(..., alias="captionerMs")
-    llm_ms: float = Field(..., alias="llmMs")
-    total_ms: float = Field(..., alias="totalMs")
+    image_load_ms: float
+    tagger_ms: float
+    captioner_ms: float
+    llm_ms: float
+    total_ms: float
 
 
 class PipelineModels(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     tagger: str
     captioner: str
     llm: str
 
 
 class PipelineMeta(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
-    contract_version: str = Field(..., alias="contractVersion")
+    contract_version: str
     device: AiDevice
     models: PipelineModels
     timings: PipelineTimings
 
 
 class DeviceRouting(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
     clip: AiDevice
     blip: AiDevice
@@ -76,141 +95,133 @@ class DeviceRouting(BaseModel):
     strict: bool = True
 
 
-class ClipTagScore(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ClipTagScore:
+    # Debug-only leaf that can appear hundreds of times per response; a
+    # slotted dataclass avoids a BaseModel instance per entry.
     tag: str
     score: float
 
 
 class TagStat(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
     tag: str
     count: int
-    mean_score: float = Field(
-        ...,
-        validation_alias=AliasChoices("meanScore", "mean_score"),
-        serialization_alias="meanScore",
-    )
-    max_score: float = Field(
-        ...,
-        validation_alias=AliasChoices("maxScore", "max_score"),
-        serialization_alias="maxScore",
-    )
+    mean_score: float
+    max_score: float
+    frequency: float
+
+
+class ScoredTagFact(TypedDict):
+    __pydantic_config__ = ConfigDict()
+
+    tag: str
+    score: float
+
+
+class TagStatFact(TypedDict):
+    __pydantic_config__ = ConfigDict()
+
+    tag: str
+    count: int
+    meanScore: float
+    maxScore: float
     frequency: float
 
 
+class ProductFacts(TypedDict):
+    # Kept as a plain dict at runtime (it is also dumped into the LLM prompt);
+    # the TypedDict only gives pydantic a concrete schema to serialize with.
+    # An explicit config keeps AnalyzeDebug's to_camel generator off the keys.
+    __pydantic_config__ = ConfigDict()
+
+    tags_per_image: List[List[ScoredTagFact]]
+    tags_strict: List[str]
+    tags_soft: List[str]
+    tag_stats: List[TagStatFact]
+    brand_candidate: Optional[str]
+    brand_confidence: Optional[float]
+    captions_per_image: List[str]
+    caption_consensus: List[str]
+
+
 class LlmDebug(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
-
-    raw_text_truncated: Optional[str] = Field(default=None, alias="rawTextTruncated")
-    raw_text_chars: int = Field(0, alias="rawTextChars")
-    parsed_title: Optional[str] = Field(default=None, alias="parsedTitle")
-    parsed_description: Optional[str] = Field(default=None, alias="parsedDescription")
-    extracted_json_truncated: Optional[str] = Field(
-        default=None, alias="extractedJsonTruncated"
-    )
-    extracted_json: Optional[str] = Field(default=None, alias="extractedJson")
-    extracted_json_chars: Optional[int] = Field(
-        default=None, alias="extractedJsonChars"
-    )
-    json_parse_error: Optional[str] = Field(default=None, alias="jsonParseError")
-    schema_error: Optional[str] = Field(default=None, alias="schemaError")
-    title_length_warning: Optional[str] = Field(
-        default=None, alias="titleLengthWarning"
-    )
-    llm_init_ms: Optional[float] = Field(default=None, alias="llmInitMs")
-    llm_generate_ms: Optional[float] = Field(default=None, alias="llmGenerateMs")
-    llm_device_requested: Optional[str] = Field(
-        default=None, alias="llmDeviceRequested"
-    )
-    llm_device_resolved: Optional[str] = Field(
-        default=None, alias="llmDeviceResolved"
-    )
-    llm_timeout_hit: Optional[bool] = Field(default=None, alias="llmTimeoutHit")
-    stop_strings_used: Optional[List[str]] = Field(
-        default=None, alias="stopStringsUsed"
-    )
-    stop_triggered: Optional[bool] = Field(default=None, alias="stopTriggered")
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
+
+    raw_text_truncated: Optional[str] = None
+    raw_text_chars: int = 0
+    parsed_title: Optional[str] = None
+    parsed_description: Optional[str] = None
+    extracted_json_truncated: Optional[str] = None
+    extracted_json: Optional[str] = None
+    extracted_json_chars: Optional[int] = None
+    json_parse_error: Optional[str] = None
+    schema_error: Optional[str] = None
+    title_length_warning: Optional[str] = None
+    llm_init_ms: Optional[float] = None
+    llm_generate_ms: Optional[float] = None
+    llm_device_requested: Optional[str] = None
+    llm_device_resolved: Optional[str] = None
+    llm_timeout_hit: Optional[bool] = None
+    stop_strings_used: Optional[List[str]] = None
+    stop_triggered: Optional[bool] = None
 
 
 class AnalyzeDebug(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
-
-    clip_tags_top: List[ClipTagScore] = Field(
-        default_factory=list, alias="clipTagsTop"
-    )
-    clip_tags_per_image: Optional[List[List[ClipTagScore]]] = Field(
-        default=None, alias="clipTagsPerImage"
-    )
-    clip_tags_image_1: List[ClipTagScore] = Field(
-        default_factory=list, alias="clipTagsImage1"
-    )
-    clip_tags_image_2: List[ClipTagScore] = Field(
-        default_factory=list, alias="clipTagsImage2"
-    )
-    clip_tags_intersection: List[str] = Field(
-        default_factory=list, alias="clipTagsIntersection"
-    )
-    tag_merge_strategy: Optional[str] = Field(
-        default=None, alias="tagMergeStrategy"
-    )
-    tag_merge_fallback: Optional[str] = Field(
-        default=None, alias="tagMergeFallback"
-    )
-    tags_strict: List[str] = Field(default_factory=list, alias="tagsStrict")
-    tags_soft: List[str] = Field(default_factory=list, alias="tagsSoft")
-    tag_stats: List[TagStat] = Field(default_factory=list, alias="tagStats")
-    tags_per_image: Optional[List[List[ClipTagScore]]] = Field(
-        default=None, alias="tagsPerImage"
-    )
-    brand_candidate: Optional[str] = Field(
-        default=None, alias="brandCandidate"
-    )
-    brand_confidence: Optional[float] = Field(
-        default=None, alias="brandConfidence"
-    )
-    blip_caption: Optional[str] = Field(default=None, alias="blipCaption")
-    blip_captions_per_image: Optional[List[str]] = Field(
-        default=None, alias="blipCaptionsPerImage"
-    )
-    blip_caption_image_1: Optional[str] = Field(
-        default=None, alias="blipCaptionImage1"
-    )
-    blip_caption_image_2: Optional[str] = Field(
-        default=None, alias="blipCaptionImage2"
-    )
-    captions_sent_to_llm: List[str] = Field(
-        default_factory=list, alias="captionsSentToLlm"
-    )
-    caption_consensus: List[str] = Field(
-        default_factory=list, alias="captionConsensus"
-    )
-    captions_per_image: Optional[List[str]] = Field(
-        default=None, alias="captionsPerImage"
-    )
-    product_facts: Optional[dict[str, object]] = Field(
-        default=None, alias="productFacts"
-    )
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
+
+    clip_tags_top: List[ClipTagScore] = Field(default_factory=list)
+    clip_tags_per_image: Optional[List[List[ClipTagScore]]] = None
+    clip_tags_image_1: List[ClipTagScore] = Field(default_factory=list)
+    clip_tags_image_2: List[ClipTagScore] = Field(default_factory=list)
+    clip_tags_intersection: List[str] = Field(default_factory=list)
+    tag_merge_strategy: Optional[str] = None
+    tag_merge_fallback: Optional[str] = None
+    tags_strict: List[str] = Field(default_factory=list)
+    tags_soft: List[str] = Field(default_factory=list)
+    tag_stats: List[TagStat] = Field(default_factory=list)
+    tags_per_image: Optional[List[List[ClipTagScore]]] = None
+    brand_candidate: Optional[str] = None
+    brand_confidence: Optional[float] = None
+    blip_caption: Optional[str] = None
+    blip_captions_per_image: Optional[List[str]] = None
+    blip_caption_image_1: Optional[str] = None
+    blip_caption_image_2: Optional[str] = None
+    captions_sent_to_llm: List[str] = Field(default_factory=list)
+    caption_consensus: List[str] = Field(default_factory=list)
+    captions_per_image: Optional[List[str]] = None
+    product_facts: Optional[ProductFacts] = None
     llm: LlmDebug
 
 
 class AnalyzeProductRequest(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    # Not deferred: FastAPI wraps the body model in a TypeAdapter carrying the
+    # parameter alias, and a deferred model makes pydantic warn about it.
+    model_config = ConfigDict(alias_generator=to_camel, validate_by_name=True)
 
-    job_id: Optional[int] = Field(default=None, alias="jobId")
+    job_id: Optional[int] = None
     price: Money
-    images: List[ImageRef] = Field(..., min_items=1)
+    images: List[ImageRef] = Field(..., min_length=1)
     lang: Optional[LanguageCode] = None
-    max_tags: Optional[int] = Field(default=None, alias="maxTags")
-    max_captions: Optional[int] = Field(default=None, alias="maxCaptions")
+    max_tags: Optional[int] = None
+    max_captions: Optional[int] = None
     debug: bool = False
-    debug_include_prompt: bool = Field(default=False, alias="debugIncludePrompt")
+    debug_include_prompt: bool = False
 
 
 class AnalyzeProductResponse(BaseModel):
-    model_config = ConfigDict(validate_by_name=True)
+    model_config = ConfigDict(
+        defer_build=True, alias_generator=to_camel, validate_by_name=True
+    )
 
-    job_id: Optional[int] = Field(default=None, alias="jobId")
+    job_id: Optional[int] = None
     title: str
     description: str
     tags: List[Tag]
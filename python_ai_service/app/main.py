@@ -1,7 +1,13 @@
+import email.message
 import logging
-from fastapi import Response, FastAPI, Request, status
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, Response, FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import ValidationError
 
 from .contracts_models import AnalyzeProductRequest, AnalyzeProductResponse
 from .services.jobs import analyze
@@ -16,7 +22,71 @@ settings = get_settings()
 logger = logging.getLogger("tvwallau-ai")
 logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
 
-app = FastAPI(title="TvWallauShop AI Product Service", version="0.2.0")
+
+def _load_tokenizers_extension() -> None:
+    try:
+        info = ensure_openvino_tokenizers_extension_loaded()
+        logger.info(
+            "Loaded OpenVINO tokenizers extension: %s",
+            info["dll_path"],
+        )
+    except AiServiceError as exc:
+        logger.error(
+            "OpenVINO tokenizers extension unavailable: %s",
+            exc.message,
+        )
+
+
+def _check_models() -> None:
+    if settings.MODEL_FETCH_MODE == "never":
+        return
+    logger.info(
+        "Ensuring model assets MODE=%s OFFLINE=%s",
+        settings.MODEL_FETCH_MODE,
+        settings.OFFLINE,
+    )
+    try:
+        ensure_models(
+            mode=settings.MODEL_FETCH_MODE,
+            offline=settings.OFFLINE,
+            settings=settings,
+        )
+    except AiServiceError as exc:
+        details = exc.details or {}
+        logger.error(
+            "Model startup check failed: code=%s message=%s stdout_tail=%s stderr_tail=%s",
+            exc.code,
+            exc.message,
+            details.get("stdout_tail"),
+            details.get("stderr_tail"),
+        )
+        raise RuntimeError("Model startup check failed.") from exc
+    except Exception as exc:
+        logger.error("Model startup check failed unexpectedly: %s", exc)
+        raise RuntimeError("Model startup check failed unexpectedly.") from exc
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The response model (and its nested contract models) use defer_build;
+    # build it and the cached OpenAPI document here so the first request does
+    # not pay for it.
+    AnalyzeProductResponse.model_rebuild()
+    app.openapi()
+    _load_tokenizers_extension()
+    _check_models()
+    if settings.LLM_PRELOAD_ON_STARTUP:
+        routing = settings.device_routing()
+        logger.info("Preloading LLM pipeline for device=%s", routing.llm)
+        preload_llm_copywriter(routing.llm)
+    yield
+
+
+app = FastAPI(
+    title="TvWallauShop AI Product Service",
+    version="0.2.0",
+    lifespan=lifespan,
+)
 
 
 @app.exception_handler(AiServiceError)
@@ -41,82 +111,107 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
     )
 
 
-@app.get("/health", status_code=200)
-async def health_get():
+class _GetOrHeadRoute(APIRoute):
+    """A GET route that also answers HEAD.
+
+    Registering methods=["GET", "HEAD"] would publish both operations in the
+    OpenAPI document under the same operationId, so the route stays GET-only
+    there and HEAD is matched here instead.
+    """
+
+    def matches(self, scope):
+        if scope["type"] == "http" and scope["method"] == "HEAD":
+            scope = {**scope, "method": "GET"}
+        return super().matches(scope)
+
+    async def handle(self, scope, receive, send):
+        if scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        await super().handle(scope, receive, send)
+
+
+health_router = APIRouter(route_class=_GetOrHeadRoute)
+
+
+@health_router.get("/health", status_code=200)
+async def health(request: Request):
+    if request.method == "HEAD":
+        return Response(status_code=200)
     return {"status": "ok"}
 
 
-@app.on_event("startup")
-async def startup_check_models() -> None:
-    try:
-        info = ensure_openvino_tokenizers_extension_loaded()
-        logger.info(
-            "Loaded OpenVINO tokenizers extension: %s",
-            info["dll_path"],
-        )
-    except AiServiceError as exc:
-        logger.error(
-            "OpenVINO tokenizers extension unavailable: %s",
-            exc.message,
-        )
-    if settings.MODEL_FETCH_MODE != "never":
-        logger.info(
-            "Ensuring model assets MODE=%s OFFLINE=%s",
-            settings.MODEL_FETCH_MODE,
-            settings.OFFLINE,
-        )
-        try:
-            ensure_models(
-                mode=settings.MODEL_FETCH_MODE,
-                offline=settings.OFFLINE,
-                settings=settings,
-            )
-        except AiServiceError as exc:
-            details = exc.details or {}
-            logger.error(
-                "Model startup check failed: code=%s message=%s stdout_tail=%s stderr_tail=%s",
-                exc.code,
-                exc.message,
-                details.get("stdout_tail"),
-                details.get("stderr_tail"),
-            )
-            raise RuntimeError("Model startup check failed.") from exc
-        except Exception as exc:
-            logger.error("Model startup check failed unexpectedly: %s", exc)
-            raise RuntimeError("Model startup check failed unexpectedly.") from exc
-    if settings.LLM_PRELOAD_ON_STARTUP:
-        routing = settings.device_routing()
-        logger.info("Preloading LLM pipeline for device=%s", routing.llm)
-        preload_llm_copywriter(routing.llm)
+app.include_router(health_router)
+
+
+def _is_json_content_type(value: str | None) -> bool:
+    """Same test FastAPI applies before it parses a request body as JSON."""
+    if not value:
+        return False
+    message = email.message.Message()
+    message["content-type"] = value
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+class _JsonBodyRoute(APIRoute):
+    """Validate the JSON body from raw bytes with pydantic-core.
+
+    Skips FastAPI's json.loads + dependency solving. Only for endpoints whose
+    sole parameter is the body model and that return a Response themselves.
+    Empty bodies, non-JSON content types and malformed JSON go through the
+    stock handler so their 422 errors stay exactly as before.
+    """
 
+    def get_route_handler(self):
+        body_model = self.body_field.field_info.annotation
+        endpoint = self.endpoint
+        fallback = super().get_route_handler()
 
-@app.head("/health", status_code=200)
-async def health_head():
-    return Response(status_code=200)
+        async def handler(request: Request) -> Response:
+            body = await request.body()
+            if not body or not _is_json_content_type(
+                request.headers.get("content-type")
+            ):
+                return await fallback(request)
+            try:
+                payload = body_model.model_validate_json(body)
+            except ValidationError as exc:
+                errors = exc.errors(include_url=False)
+                if any(error["type"] == "json_invalid" for error in errors):
+                    return await fallback(request)
+                raise RequestValidationError(
+                    [{**error, "loc": ("body", *error["loc"])} for error in errors]
+                ) from exc
+            return await endpoint(payload)
 
+        return handler
 
-@app.post(
+
+analyze_router = APIRouter(route_class=_JsonBodyRoute)
+
+
+@analyze_router.post(
     "/analyze-product",
     response_model=AnalyzeProductResponse,
     status_code=status.HTTP_200_OK,
 )
 async def analyze_product(payload: AnalyzeProductRequest):
-    try:
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "analyze-product job_id=%s price=%s images=%s",
             payload.job_id,
             payload.price.amount,
             len(payload.images),
         )
-        return analyze(payload)
-    except AiServiceError as exc:
-        logger.warning("AI analyze failed: %s", exc.message)
-        payload = exc.to_contract_dict()
-        if exc.debug is not None:
-            payload["debug"] = jsonable_encoder(
-                exc.debug, by_alias=True, exclude_none=True
-            )
-        return JSONResponse(status_code=exc.http_status, content=payload)
+    # AiServiceError is turned into its contract payload by the app-level
+    # handler; anything else still reports the caller's jobId.
+    try:
+        content = analyze(payload).model_dump_json(by_alias=True)
+    except AiServiceError:
+        raise
     except Exception as exc:
         logger.exception("Unexpected AI analyze failure")
         return JSONResponse(
@@ -128,3 +223,9 @@ async def analyze_product(payload: AnalyzeProductRequest):
                 "jobId": payload.job_id,
             },
         )
+    # Returning a Response skips FastAPI's second validation pass over the
+    # (already validated) response model; response_model still documents it.
+    return Response(content=content, media_type="application/json")
+
+
+app.include_router(analyze_router)
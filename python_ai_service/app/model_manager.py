@@ -6,21 +6,29 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable
 
-import openvino as ov
-from filelock import FileLock
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    from filelock import FileLock
 
 from .config import Settings, get_settings
 from .services.errors import AiServiceError
 
 logger = logging.getLogger("tvwallau-ai")
 
-@dataclass
+@dataclass(slots=True)
 class ModelSpec:
     name: str
     source_kind: str
@@ -32,7 +40,8 @@ class ModelSpec:
     actual_dir: Path | None = None
 
     def missing_files(self) -> list[str]:
-        return [str(self.target_dir / fname) for fname in self.required_files]
+        target = str(self.target_dir)
+        return [os.path.join(target, fname) for fname in self.required_files]
 
     def build_conversion_command(self) -> tuple[str, ...] | None:
         if self.source_kind != "hf_export" or self.converter in {
@@ -50,7 +59,7 @@ class ModelSpec:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssetCheck:
     missing: list[str]
     checked_dir: Path
@@ -62,12 +71,58 @@ class AssetCheck:
         return bool(self.missing)
 
 
+# Directories created by this process that nothing here ever removes; model
+# target dirs are deliberately excluded since ensure_models may rmtree them.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _raise_models_being_prepared(lock_path: Path) -> None:
+    raise AiServiceError(
+        code="MODEL_NOT_AVAILABLE",
+        message="Model assets are being prepared by another process.",
+        details={"lock": str(lock_path)},
+        http_status=503,
+    )
+
+
 @contextmanager
-def _model_lock(lock_path: Path) -> Iterable[None]:
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    lock = FileLock(str(lock_path))
-    with lock:
+def _model_lock(
+    lock_path: Path, shared: bool = False, blocking: bool = True
+) -> Iterable[None]:
+    # Preparation takes the lock exclusively for its whole run; readiness checks
+    # take it shared. With blocking=False a running preparation raises
+    # MODEL_NOT_AVAILABLE instead of waiting.
+    _ensure_dir(lock_path.parent)
+    if fcntl is None:
+        # Windows has no shared file locks. A non-blocking check would have
+        # to hold the exclusive lock and serialize every request, so it runs
+        # unlocked; it only reports ready once all required files exist.
+        if shared and not blocking:
+            yield
+            return
+        with FileLock(str(lock_path)):
+            yield
+        return
+    # flock blocks in the kernel until the holder is done instead of polling;
+    # closing the descriptor releases the lock.
+    operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    if not blocking:
+        operation |= fcntl.LOCK_NB
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, operation)
+        except BlockingIOError:
+            _raise_models_being_prepared(lock_path)
         yield
+    finally:
+        os.close(fd)
 
 
 def model_fetch_hint() -> str:
@@ -89,7 +144,6 @@ def build_model_specs(settings: Settings) -> dict[str, ModelSpec]:
         "text_encoder.bin",
         "tokenizer.json",
     )
-    Path(settings.OV_CLIP_DIR).mkdir(parents=True, exist_ok=True)
     llm_source = settings.LLM_SOURCE
     if llm_source not in {"prebuilt_ov_ir", "hf_export"}:
         raise AiServiceError(
@@ -169,22 +223,106 @@ def build_model_specs(settings: Settings) -> dict[str, ModelSpec]:
 
 
 def _list_files(directory: Path) -> list[str]:
-    if not directory.exists() or not directory.is_dir():
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entry.name for entry in entries if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(path.name for path in directory.iterdir() if path.is_file())
+
+
+# target_dir -> (target_dir st_mtime_ns, resolved IR dir, its st_mtime_ns).
+# Both mtimes are part of the key: files added to or removed from an existing
+# IR subdirectory only move that subdirectory's mtime. ensure_models also drops
+# entries after its own rmtree/conversion via _invalidate_asset_caches.
+_IR_DIR_CACHE: dict[Path, tuple[int, Path, int]] = {}
+# (spec name, target_dir) -> (directory mtimes key, AssetCheck)
+_ASSET_CHECK_CACHE: dict[tuple[str, Path], tuple[tuple[object, ...], AssetCheck]] = {}
+# Both caches are read and written from request threads and from parallel
+# preparation workers.
+_ASSET_CACHE_LOCK = threading.Lock()
+# mtimes are coarse (about 16 ms on NTFS, a jiffy on older Linux kernels), so
+# two changes in the same tick look identical. Like git's racy-index rule,
+# only cache results whose directory mtimes are at least this old.
+_SETTLED_MTIME_NS = 2_000_000_000
+
+
+def _mtimes_settled(*mtimes_ns: int) -> bool:
+    return time.time_ns() - max(mtimes_ns) >= _SETTLED_MTIME_NS
+
+
+def _invalidate_asset_caches(target_dir: Path) -> None:
+    with _ASSET_CACHE_LOCK:
+        _IR_DIR_CACHE.pop(target_dir, None)
+        for cache_id in [key for key in _ASSET_CHECK_CACHE if key[1] == target_dir]:
+            del _ASSET_CHECK_CACHE[cache_id]
 
 
 def _find_ir_dir(target_dir: Path) -> Path | None:
-    if not target_dir.exists():
+    try:
+        mtime_ns = target_dir.stat().st_mtime_ns
+    except OSError:
+        _invalidate_asset_caches(target_dir)
         return None
-    xml_dirs = {path.parent for path in target_dir.rglob("*.xml") if path.is_file()}
-    bin_dirs = {path.parent for path in target_dir.rglob("*.bin") if path.is_file()}
-    candidates = xml_dirs & bin_dirs
-    if not candidates:
+    with _ASSET_CACHE_LOCK:
+        cached = _IR_DIR_CACHE.get(target_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        ir_dir = cached[1]
+        if ir_dir == target_dir:
+            return ir_dir
+        try:
+            if ir_dir.stat().st_mtime_ns == cached[2]:
+                return ir_dir
+        except OSError:
+            pass
+    actual = _scan_ir_dir(target_dir)
+    if actual is None:
+        # Not cached: the IR may still appear inside an existing subdirectory,
+        # which would not move target_dir's mtime.
+        with _ASSET_CACHE_LOCK:
+            _IR_DIR_CACHE.pop(target_dir, None)
         return None
-    if target_dir in candidates:
-        return target_dir
-    return sorted(candidates, key=lambda path: (len(path.parts), str(path)))[0]
+    try:
+        actual_mtime_ns = (
+            mtime_ns if actual == target_dir else actual.stat().st_mtime_ns
+        )
+    except OSError:
+        return actual
+    if _mtimes_settled(mtime_ns, actual_mtime_ns):
+        with _ASSET_CACHE_LOCK:
+            _IR_DIR_CACHE[target_dir] = (mtime_ns, actual, actual_mtime_ns)
+    return actual
+
+
+def _scan_ir_dir(target_dir: Path) -> Path | None:
+    # Breadth-first scandir walk: exports put the IR at target_dir or one level
+    # below, so the shallowest level holding a candidate ends the search there.
+    # DirEntry type info avoids a stat per entry, and dot dirs (e.g. the .cache
+    # left by snapshot_download) never hold IR files.
+    level = [target_dir]
+    while level:
+        candidates: list[Path] = []
+        next_level: list[Path] = []
+        for directory in level:
+            has_xml = has_bin = False
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith("."):
+                                next_level.append(Path(entry.path))
+                        elif name.endswith(".xml"):
+                            has_xml = has_xml or entry.is_file()
+                        elif name.endswith(".bin"):
+                            has_bin = has_bin or entry.is_file()
+            except OSError:
+                continue
+            if has_xml and has_bin:
+                candidates.append(directory)
+        if candidates:
+            return min(candidates, key=str)
+        level = next_level
+    return None
 
 
 def _update_actual_dir(spec: ModelSpec) -> None:
@@ -193,104 +331,155 @@ def _update_actual_dir(spec: ModelSpec) -> None:
         spec.actual_dir = actual
 
 
+_CAPTION_PROCESSOR_FILES = (
+    "preprocessor_config.json",
+    "tokenizer.json",
+    "tokenizer_config.json",
+    "special_tokens_map.json",
+    "vocab.txt",
+    "merges.txt",
+)
+_LLM_TOKENIZER_IR = frozenset(
+    {
+        "openvino_tokenizer.xml",
+        "openvino_tokenizer.bin",
+        "openvino_detokenizer.xml",
+        "openvino_detokenizer.bin",
+    }
+)
+_LLM_EXPECTED_FILES = (
+    "openvino_model.xml",
+    "openvino_model.bin",
+    "tokenizer.json",
+    "tokenizer.model",
+    "config.json",
+    *sorted(_LLM_TOKENIZER_IR),
+)
+
+
 def check_assets(spec: ModelSpec) -> AssetCheck:
     _update_actual_dir(spec)
     checked_dir = spec.actual_dir or spec.target_dir
+    try:
+        target_mtime = spec.target_dir.stat().st_mtime_ns
+    except OSError:
+        # No target dir (fresh install or just removed): there is nothing to
+        # list, so report every expected file as missing without scanning.
+        return _check_assets(spec, checked_dir, [], frozenset(), frozenset())
+    # The result only depends on the listings of checked_dir and target_dir,
+    # so it stays valid until either directory's mtime moves.
+    cache_id = (spec.name, spec.target_dir)
+    key: tuple[Path, int, int] | None
+    try:
+        key = (
+            checked_dir,
+            target_mtime,
+            target_mtime
+            if checked_dir == spec.target_dir
+            else checked_dir.stat().st_mtime_ns,
+        )
+    except OSError:
+        key = None
+    else:
+        with _ASSET_CACHE_LOCK:
+            cached = _ASSET_CHECK_CACHE.get(cache_id)
+        if cached is not None and cached[0] == key:
+            return _copy_asset_check(cached[1])
     found_files = _list_files(checked_dir)
+    # Presence checks run against one listing per directory instead of an
+    # exists() call per candidate file.
+    checked_names = frozenset(found_files)
+    target_names = (
+        checked_names
+        if checked_dir == spec.target_dir
+        else frozenset(_list_files(spec.target_dir))
+    )
+    status = _check_assets(spec, checked_dir, found_files, checked_names, target_names)
+    if key is not None and _mtimes_settled(key[1], key[2]):
+        with _ASSET_CACHE_LOCK:
+            _ASSET_CHECK_CACHE[cache_id] = (key, _copy_asset_check(status))
+    return status
+
+
+def _copy_asset_check(status: AssetCheck) -> AssetCheck:
+    # Callers put these lists into error details; a cached result must not
+    # share them with whoever received it before.
+    return AssetCheck(
+        missing=list(status.missing),
+        checked_dir=status.checked_dir,
+        found_files=list(status.found_files),
+        expected=None if status.expected is None else list(status.expected),
+        details=dict(status.details),
+    )
+
+
+def _check_assets(
+    spec: ModelSpec,
+    checked_dir: Path,
+    found_files: list[str],
+    checked_names: frozenset[str],
+    target_names: frozenset[str],
+) -> AssetCheck:
     missing: list[str] = []
     expected: list[str] | None = None
     if spec.name == "clip":
         expected = list(spec.required_files)
-        for filename in spec.required_files:
-            checked_path = checked_dir / filename
-            if not checked_path.exists():
-                missing.append(str(checked_path))
+        missing.extend(
+            str(checked_dir / filename)
+            for filename in spec.required_files
+            if filename not in checked_names
+        )
     elif spec.name == "caption":
         expected = list(spec.required_files)
-        for filename in spec.required_files:
-            checked_path = checked_dir / filename
-            fallback_path = spec.target_dir / filename
-            if not checked_path.exists() and not fallback_path.exists():
-                missing.append(str(checked_path))
-        processor_candidates = (
-            "preprocessor_config.json",
-            "tokenizer.json",
-            "tokenizer_config.json",
-            "special_tokens_map.json",
-            "vocab.txt",
-            "merges.txt",
+        missing.extend(
+            str(checked_dir / filename)
+            for filename in spec.required_files
+            if filename not in checked_names and filename not in target_names
         )
-        if not any((checked_dir / name).exists() for name in processor_candidates):
-            missing.extend(str(checked_dir / name) for name in processor_candidates)
-            expected.extend(name for name in processor_candidates if name not in expected)
+        if checked_names.isdisjoint(_CAPTION_PROCESSOR_FILES):
+            missing.extend(str(checked_dir / name) for name in _CAPTION_PROCESSOR_FILES)
+            expected.extend(
+                name for name in _CAPTION_PROCESSOR_FILES if name not in expected
+            )
     elif spec.name == "llm":
-        expected = list(spec.required_files)
         details: dict[str, object] = {}
-        model_xml = checked_dir / "openvino_model.xml"
-        model_bin = checked_dir / "openvino_model.bin"
-        if not model_xml.exists():
-            missing.append(str(model_xml))
-        if not model_bin.exists():
-            missing.append(str(model_bin))
-        tokenizer_json = checked_dir / "tokenizer.json"
-        tokenizer_model = checked_dir / "tokenizer.model"
-        tokenizer_present = tokenizer_json.exists() or tokenizer_model.exists()
-        if not tokenizer_present:
-            fallback_json = spec.target_dir / "tokenizer.json"
-            fallback_model = spec.target_dir / "tokenizer.model"
-            tokenizer_present = fallback_json.exists() or fallback_model.exists()
-        if not tokenizer_present:
+        missing.extend(
+            str(checked_dir / name)
+            for name in ("openvino_model.xml", "openvino_model.bin")
+            if name not in checked_names
+        )
+        tokenizer_files = ("tokenizer.json", "tokenizer.model")
+        if checked_names.isdisjoint(tokenizer_files) and target_names.isdisjoint(
+            tokenizer_files
+        ):
             missing.append("tokenizer.json or tokenizer.model")
-        config_path = checked_dir / "config.json"
-        fallback_config = spec.target_dir / "config.json"
-        if not config_path.exists() and not fallback_config.exists():
-            missing.append(str(config_path))
-        tokenizer_ir = {
-            "openvino_tokenizer.xml",
-            "openvino_tokenizer.bin",
-            "openvino_detokenizer.xml",
-            "openvino_detokenizer.bin",
-        }
-        tokenizer_ir_present = all((checked_dir / name).exists() for name in tokenizer_ir)
-        if tokenizer_ir_present:
+        if "config.json" not in checked_names and "config.json" not in target_names:
+            missing.append(str(checked_dir / "config.json"))
+        if _LLM_TOKENIZER_IR <= checked_names:
             logger.info("Tokenizer IR present in %s", checked_dir)
             details["tokenizer_ir_missing"] = False
         else:
             details["tokenizer_ir_missing"] = True
-        expected = list(
-            dict.fromkeys(
-                [
-                    "openvino_model.xml",
-                    "openvino_model.bin",
-                    "tokenizer.json",
-                    "tokenizer.model",
-                    "config.json",
-                    *sorted(tokenizer_ir),
-                ]
-            )
-        )
         return AssetCheck(
             missing=missing,
             checked_dir=checked_dir,
             found_files=found_files,
-            expected=expected,
+            expected=list(_LLM_EXPECTED_FILES),
             details=details,
         )
     else:
         expected_ir = ["*.xml", "*.bin"]
-        xml_found = any(checked_dir.glob("*.xml"))
-        bin_found = any(checked_dir.glob("*.bin"))
-        if not xml_found:
+        if not any(name.endswith(".xml") for name in found_files):
             missing.append("*.xml")
-        if not bin_found:
+        if not any(name.endswith(".bin") for name in found_files):
             missing.append("*.bin")
-        for filename in spec.required_files:
-            if filename.endswith((".xml", ".bin")):
-                continue
-            checked_path = checked_dir / filename
-            fallback_path = spec.target_dir / filename
-            if not checked_path.exists() and not fallback_path.exists():
-                missing.append(str(checked_path))
+        missing.extend(
+            str(checked_dir / filename)
+            for filename in spec.required_files
+            if not filename.endswith((".xml", ".bin"))
+            and filename not in checked_names
+            and filename not in target_names
+        )
         expected = expected_ir if any(entry in expected_ir for entry in missing) else None
     return AssetCheck(
         missing=missing,
@@ -329,19 +518,24 @@ def _raise_model_missing(
     )
 
 
+_CONVERSION_ENV_DEFAULTS = {"PYTHONUTF8": "1", "PYTHONIOENCODING": "utf-8"}
+_OFFLINE_ENV_DEFAULTS = {"HF_HUB_OFFLINE": "1", "TRANSFORMERS_OFFLINE": "1"}
+
+
 def _conversion_env(settings: Settings, offline: bool) -> dict[str, str]:
-    env = os.environ.copy()
     model_dir = Path(settings.MODEL_DIR)
-    env.setdefault("HF_HOME", str(model_dir / ".hf_home"))
-    env.setdefault("HUGGINGFACE_HUB_CACHE", str(model_dir / ".hf_cache"))
-    env.setdefault("PYTHONUTF8", "1")
-    env.setdefault("PYTHONIOENCODING", "utf-8")
-    if offline:
-        env.setdefault("HF_HUB_OFFLINE", "1")
-        env.setdefault("TRANSFORMERS_OFFLINE", "1")
-    return env
+    # Defaults first so anything already set in the environment wins, as
+    # setdefault did; the merge builds the child env in a single dict.
+    return {
+        "HF_HOME": str(model_dir / ".hf_home"),
+        "HUGGINGFACE_HUB_CACHE": str(model_dir / ".hf_cache"),
+        **_CONVERSION_ENV_DEFAULTS,
+        **(_OFFLINE_ENV_DEFAULTS if offline else {}),
+        **os.environ,
+    }
 
 
+@lru_cache(maxsize=1)
 def _find_optimum_cli() -> str | None:
     executable = shutil.which("optimum-cli") or shutil.which("optimum-cli.exe")
     if executable:
@@ -363,8 +557,77 @@ def _tail_output(value: str | None, limit: int = 4000) -> str | None:
     return value[-limit:]
 
 
+def _read_tail(stream: IO[str], limit: int, sink: list[str]) -> None:
+    chunks: deque[str] = deque()
+    size = 0
+    for chunk in iter(partial(stream.read, 4096), ""):
+        chunks.append(chunk)
+        size += len(chunk)
+        while size - len(chunks[0]) >= limit:
+            size -= len(chunks.popleft())
+    sink.append("".join(chunks)[-limit:])
+
+
+def _run_with_output_tails(
+    command: list[str],
+    env: dict[str, str],
+    limit: int = 4000,
+    timeout: float | None = None,
+) -> tuple[int, str, str]:
+    # Exports print many MB of progress output; only the tail is ever reported,
+    # so drain both pipes into bounded buffers instead of capturing everything.
+    # Decode as UTF-8 with replacement so stray bytes cannot kill a reader and
+    # leave the child blocked on a full pipe.
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+    )
+    stdout_tail: list[str] = []
+    stderr_tail: list[str] = []
+    reader_errors: list[BaseException] = []
+
+    def drain(stream: IO[str], sink: list[str]) -> None:
+        try:
+            _read_tail(stream, limit, sink)
+        except BaseException as exc:
+            reader_errors.append(exc)
+            # Nothing reads this pipe any more; stop the child rather than let
+            # it block on a full pipe forever.
+            process.kill()
+
+    readers = [
+        threading.Thread(target=drain, args=(process.stdout, stdout_tail)),
+        threading.Thread(target=drain, args=(process.stderr, stderr_tail)),
+    ]
+    for reader in readers:
+        reader.start()
+    timed_out = False
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        process.kill()
+        returncode = process.wait()
+    finally:
+        for reader in readers:
+            reader.join()
+        process.stdout.close()
+        process.stderr.close()
+    if reader_errors:
+        raise reader_errors[0]
+    stderr = "".join(stderr_tail)
+    if timed_out:
+        stderr = f"{stderr}\nTimed out after {timeout:.0f}s; converter killed."
+    return returncode, "".join(stdout_tail), stderr
+
+
 def _run_conversion(
-    spec: ModelSpec, settings: Settings, offline: bool
+    spec: ModelSpec, settings: Settings, offline: bool, env: dict[str, str]
 ) -> tuple[str | None, str | None]:
     spec.target_dir.mkdir(parents=True, exist_ok=True)
     if spec.source_kind == "hf_snapshot":
@@ -433,46 +696,140 @@ def _run_conversion(
                 http_status=503,
             )
         command[0] = optimum_cli
-    try:
-        result = subprocess.run(
-            command,
-            check=True,
-            capture_output=True,
-            text=True,
-            env=_conversion_env(settings, offline),
-        )
-        return result.stdout, result.stderr
-    except subprocess.CalledProcessError as exc:
+    returncode, stdout_tail, stderr_tail = _run_with_output_tails(
+        command, env=env, timeout=settings.MODEL_CONVERSION_TIMEOUT_SEC
+    )
+    if returncode != 0:
         raise AiServiceError(
             code="MODEL_NOT_AVAILABLE",
             message=f"Failed to convert/download {spec.name} model. {model_fetch_hint()}",
             details={
                 "model": spec.name,
                 "cmd": command,
-                "returncode": exc.returncode,
-                "stdout_tail": _tail_output(exc.stdout),
-                "stderr_tail": _tail_output(exc.stderr),
+                "returncode": returncode,
+                "stdout_tail": stdout_tail or None,
+                "stderr_tail": stderr_tail or None,
             },
             http_status=503,
-        ) from exc
+        )
+    return stdout_tail, stderr_tail
 
 
-def _write_manifest(model_dir: Path, specs: list[ModelSpec]) -> None:
+def _read_manifest(manifest_path: Path) -> dict | None:
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _write_manifest(
+    model_dir: Path, specs: list[ModelSpec], refresh: bool = False
+) -> None:
+    models = [
+        {
+            "name": spec.name,
+            "source": spec.hf_id,
+            "directory": str(spec.target_dir),
+            "required_files": list(spec.required_files),
+        }
+        for spec in specs
+    ]
+    manifest_path = model_dir / "manifest.json"
+    if not refresh:
+        # Nothing was converted: keep an identical manifest (and its mtime and
+        # generated_at) instead of rewriting it on every download-mode start.
+        existing = _read_manifest(manifest_path)
+        if (
+            existing is not None
+            and existing.get("ready") is True
+            and existing.get("models") == models
+        ):
+            return
     manifest = {
         "ready": True,
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "models": [
-            {
-                "name": spec.name,
-                "source": spec.hf_id,
-                "directory": str(spec.target_dir),
-                "required_files": list(spec.required_files),
-            }
-            for spec in specs
-        ],
+        "models": models,
     }
-    model_dir.mkdir(parents=True, exist_ok=True)
-    (model_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    _ensure_dir(model_dir)
+    # Write next to the target and swap it in, so readers never see a
+    # half-written manifest; the pid keeps workers that finish together from
+    # sharing a temp file.
+    tmp_path = model_dir / f".manifest.json.{os.getpid()}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+
+def _prepare_spec(
+    spec: ModelSpec,
+    status: AssetCheck,
+    mode: str,
+    settings: Settings,
+    offline: bool,
+    env: dict[str, str],
+) -> None:
+    if spec.target_dir.exists():
+        if (
+            mode == "force"
+            and spec.source_kind == "hf_snapshot"
+            and not status.missing
+            and settings.MODEL_FORCE_RESYNC_IN_PLACE
+        ):
+            # Opt-in: snapshot_download re-syncs a local_dir in place and only
+            # refetches files whose metadata changed upstream, keeping the
+            # multi-GB weights. It does not repair corrupted files or remove
+            # leftovers from another revision, so plain force still wipes.
+            print(
+                f"{spec.name.upper()} snapshot is complete; re-syncing in place.",
+                file=sys.stderr,
+            )
+        elif mode == "force":
+            shutil.rmtree(spec.target_dir)
+            _invalidate_asset_caches(spec.target_dir)
+            spec.actual_dir = None
+        elif status.missing:
+            print(
+                f"{spec.name.upper()} model directory appears incomplete; "
+                "removing before re-export.",
+                file=sys.stderr,
+            )
+            shutil.rmtree(spec.target_dir)
+            _invalidate_asset_caches(spec.target_dir)
+            spec.actual_dir = None
+    conversion_stdout, conversion_stderr = _run_conversion(
+        spec, settings, offline, env
+    )
+    _invalidate_asset_caches(spec.target_dir)
+    status = check_assets(spec)
+    if status.missing:
+        _raise_model_missing(
+            spec,
+            status,
+            stdout_tail=_tail_output(conversion_stdout),
+            stderr_tail=_tail_output(conversion_stderr),
+        )
+
+
+def _pending_specs(
+    specs: dict[str, ModelSpec], mode: str, offline: bool
+) -> list[tuple[ModelSpec, AssetCheck]]:
+    pending: list[tuple[ModelSpec, AssetCheck]] = []
+    for spec in specs.values():
+        status = check_assets(spec)
+        if not status.missing and mode != "force":
+            continue
+        if offline:
+            if not status.missing:
+                status = AssetCheck(
+                    missing=spec.missing_files(),
+                    checked_dir=spec.actual_dir or spec.target_dir,
+                    found_files=_list_files(spec.actual_dir or spec.target_dir),
+                )
+            _raise_model_missing(spec, status)
+        if mode not in {"download", "force"}:
+            _raise_model_missing(spec, status)
+        pending.append((spec, status))
+    return pending
 
 
 def ensure_models(mode: str, offline: bool, settings: Settings | None = None) -> None:
@@ -495,50 +852,52 @@ def ensure_models(mode: str, offline: bool, settings: Settings | None = None) ->
     specs = build_model_specs(settings)
     model_dir = Path(settings.MODEL_DIR)
 
-    with _model_lock(model_dir / ".lock"):
-        for spec in specs.values():
-            status = check_assets(spec)
-            if not status.missing and mode != "force":
-                continue
-            if offline:
-                if not status.missing:
-                    status = AssetCheck(
-                        missing=spec.missing_files(),
-                        checked_dir=spec.actual_dir or spec.target_dir,
-                        found_files=_list_files(spec.actual_dir or spec.target_dir),
-                    )
-                _raise_model_missing(spec, status)
-            if mode in {"download", "force"}:
-                conversion_stdout = None
-                conversion_stderr = None
-                if spec.target_dir.exists():
-                    if mode == "force":
-                        shutil.rmtree(spec.target_dir)
-                        spec.actual_dir = None
-                    elif status.missing:
-                        print(
-                            f"{spec.name.upper()} model directory appears incomplete; "
-                            "removing before re-export.",
-                            file=sys.stderr,
-                        )
-                        shutil.rmtree(spec.target_dir)
-                        spec.actual_dir = None
-                conversion_stdout, conversion_stderr = _run_conversion(
-                    spec, settings, offline
-                )
-                status = check_assets(spec)
-                if status.missing:
-                    _raise_model_missing(
-                        spec,
-                        status,
-                        stdout_tail=_tail_output(conversion_stdout),
-                        stderr_tail=_tail_output(conversion_stderr),
-                    )
-            else:
-                _raise_model_missing(spec, status)
+    lock_path = model_dir / ".lock"
+    # Preparation holds the lock exclusively while it writes, so checks run
+    # under a shared lock to never accept half-written files. mode="never"
+    # runs on every request and fails fast while a preparation is running;
+    # download waits for it, and workers booting against ready models do not
+    # queue behind each other.
+    pending = None
+    if mode != "force":
+        with _model_lock(lock_path, shared=True, blocking=mode != "never"):
+            pending = _pending_specs(specs, mode, offline)
+    converted = False
+    if pending is None or pending:
+        with _model_lock(lock_path):
+            # Another worker may have converted while we waited for the lock.
+            pending = _pending_specs(specs, mode, offline)
+            if pending:
+                # The child environment is the same for all conversions, so
+                # build it once.
+                env = _conversion_env(settings, offline)
+                workers = min(max(settings.MODEL_PREPARE_WORKERS, 1), len(pending))
+                if workers == 1:
+                    for spec, status in pending:
+                        _prepare_spec(spec, status, mode, settings, offline, env)
+                else:
+                    # Opt-in: each export loads a full torch model, so running
+                    # them side by side multiplies peak RAM. Failures are
+                    # re-raised in spec order.
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        futures = [
+                            pool.submit(
+                                _prepare_spec,
+                                spec,
+                                status,
+                                mode,
+                                settings,
+                                offline,
+                                env,
+                            )
+                            for spec, status in pending
+                        ]
+                    for future in futures:
+                        future.result()
+                converted = True
 
     if not offline and mode == "download":
-        _write_manifest(model_dir, list(specs.values()))
+        _write_manifest(model_dir, list(specs.values()), refresh=converted)
 
 
 def _cli_prepare() -> int:
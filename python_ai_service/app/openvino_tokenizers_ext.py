@@ -12,6 +12,14 @@ from .services.errors import AiServiceError
 
 DLL_NAME = "openvino_tokenizers.dll"
 
+# Set once the extension has been added; the DLL stays loaded for the life of
+# the process, so later calls (one per LLM pipeline build) skip the rglob and
+# the throwaway Core.
+_LOADED_INFO: dict | None = None
+
+# Where openvino_tokenizers wheels ship the DLL, relative to the package dir.
+_KNOWN_DLL_SUBDIRS = ("lib", "libs", "bin", "")
+
 
 def _find_dlls(base: Path, limit: int = 5) -> list[Path]:
     if not base.exists():
@@ -24,12 +32,25 @@ def _find_dlls(base: Path, limit: int = 5) -> list[Path]:
     return matches
 
 
+def _find_package_dlls(base: Path) -> list[Path]:
+    # Probe the known wheel layouts first; only walk the package when the DLL
+    # sits somewhere unexpected.
+    for subdir in _KNOWN_DLL_SUBDIRS:
+        candidate = base / subdir / DLL_NAME
+        if candidate.is_file():
+            return [candidate]
+    return list(base.rglob(DLL_NAME))
+
+
 def ensure_openvino_tokenizers_extension_loaded() -> dict:
+    global _LOADED_INFO
+    if _LOADED_INFO is not None:
+        return dict(_LOADED_INFO)
     spec = importlib.util.find_spec("openvino_tokenizers")
     dlls: list[Path] = []
     if spec and spec.origin:
         base = Path(spec.origin).resolve().parent
-        dlls = list(base.rglob(DLL_NAME))
+        dlls = _find_package_dlls(base)
 
     if not dlls:
         fallback_base = Path(sys.prefix) / "Lib" / "site-packages"
@@ -55,4 +76,5 @@ def ensure_openvino_tokenizers_extension_loaded() -> dict:
 
     core = ov.Core()
     core.add_extension(str(dll_path))
-    return {"dll_path": str(dll_path)}
+    _LOADED_INFO = {"dll_path": str(dll_path)}
+    return dict(_LOADED_INFO)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 
 import openvino as ov
 
@@ -12,7 +14,17 @@ DISALLOWED_DEVICE_TOKENS = ("AUTO", "MULTI")
 
 logger = logging.getLogger("tvwallau-ai")
 
+# Querying available_devices loads every device plugin; the set does not change
+# while the process runs, so it is read from the first core only.
+_AVAILABLE_DEVICES: tuple[str, ...] | None = None
 
+_CORES: dict[str | None, ov.Core] = {}
+_CORES_LOCK = Lock()
+
+
+# Device strings come from a handful of settings values but are normalized on
+# every model lookup, so remember the few distinct results.
+@lru_cache(maxsize=16)
 def normalize_device(device: str) -> str:
     if not device:
         raise AiServiceError(
@@ -44,10 +56,26 @@ def configure_openvino_cache(core: ov.Core | None, cache_dir: str | None) -> Non
         core.set_property({"CACHE_DIR": str(cache_path)})
 
 
-def create_core(cache_dir: str | None) -> ov.Core:
-    core = ov.Core()
-    configure_openvino_cache(core, cache_dir)
-    return core
+def get_core(cache_dir: str | None) -> ov.Core:
+    # ov.Core is thread-safe; creating one per model load repeated plugin
+    # discovery on every request, so share one per cache dir.
+    core = _CORES.get(cache_dir)
+    if core is not None:
+        return core
+    with _CORES_LOCK:
+        core = _CORES.get(cache_dir)
+        if core is None:
+            core = ov.Core()
+            configure_openvino_cache(core, cache_dir)
+            _CORES[cache_dir] = core
+        return core
+
+
+def available_devices(core: ov.Core) -> tuple[str, ...]:
+    global _AVAILABLE_DEVICES
+    if _AVAILABLE_DEVICES is None:
+        _AVAILABLE_DEVICES = tuple(core.available_devices)
+    return _AVAILABLE_DEVICES
 
 
 def resolve_device(
@@ -64,7 +92,7 @@ def resolve_device(
             details={"device": device},
             http_status=400,
         )
-    available = core.available_devices
+    available = available_devices(core)
     if normalized not in available:
         raise AiServiceError(
             code="DEVICE_NOT_AVAILABLE",
@@ -72,19 +100,20 @@ def resolve_device(
             details={
                 "device_requested": device,
                 "device_resolved": normalized,
-                "available_devices": available,
+                "available_devices": list(available),
                 "model": model_name,
             },
             http_status=503,
         )
     active_logger = log or logger
-    active_logger.info(
-        "OpenVINO device resolved model=%s device_requested=%s device_resolved=%s available_devices=%s",
-        model_name or "unknown",
-        device,
-        normalized,
-        available,
-    )
+    if active_logger.isEnabledFor(logging.INFO):
+        active_logger.info(
+            "OpenVINO device resolved model=%s device_requested=%s device_resolved=%s available_devices=%s",
+            model_name or "unknown",
+            device,
+            normalized,
+            list(available),
+        )
     return normalized
 
 
@@ -12,7 +12,7 @@ from transformers import BlipProcessor
 from ...config import get_settings
 from ...contracts_models import AnalyzeDebug, Caption
 from ...model_manager import build_model_specs, check_assets, model_fetch_hint
-from ...ov_runtime import compile_strict, create_core
+from ...ov_runtime import compile_strict, get_core
 from ..errors import AiServiceError
 
 settings = get_settings()
@@ -58,7 +58,7 @@ def _resolve_caption_paths() -> CaptionPaths:
 class Captioner:
     def __init__(self, device: str) -> None:
         paths = _resolve_caption_paths()
-        core = create_core(settings.OV_CACHE_DIR)
+        core = get_core(settings.OV_CACHE_DIR)
         self.vision_encoder = compile_strict(
             core,
             core.read_model(paths.vision_encoder),
@@ -10,9 +10,9 @@ from inspect import signature
 from pathlib import Path
 
 from ...config import get_settings
-from ...contracts_models import LlmDebug
+from ...contracts_models import LlmDebug, ProductFacts
 from ...model_manager import build_model_specs, check_assets, model_fetch_hint
-from ...ov_runtime import create_core, normalize_device, require_device
+from ...ov_runtime import get_core, normalize_device, require_device
 from ...openvino_tokenizers_ext import ensure_openvino_tokenizers_extension_loaded
 from ..errors import AiServiceError
 from .prompts import COPYWRITER_SYSTEM, build_copy_prompt
@@ -243,7 +243,7 @@ class LlmCopywriter:
             init_start,
             device,
         )
-        core = create_core(settings.OV_CACHE_DIR)
+        core = get_core(settings.OV_CACHE_DIR)
         normalized_requested = normalize_device(device)
         allowed_devices = {"GPU", "NPU"}
         if normalized_requested == "CPU":
@@ -311,7 +311,7 @@ class LlmCopywriter:
         currency: str,
         tags: list[str],
         captions: list[str],
-        product_facts: dict[str, object],
+        product_facts: ProductFacts,
         debug: LlmDebug | None = None,
         include_prompt: bool = False,
         allow_debug_failure: bool = False,
@@ -44,7 +44,7 @@ def normalize_scored_tags(tags: list[Tag]) -> list[Tag]:
         if not normalized_value:
             continue
         if normalized_value not in deduped:
-            deduped[normalized_value] = Tag(
+            deduped[normalized_value] = Tag.model_construct(
                 value=normalized_value,
                 score=tag.score,
                 source=tag.source,
@@ -55,7 +55,7 @@ def normalize_scored_tags(tags: list[Tag]) -> list[Tag]:
         existing_score = existing.score or 0.0
         incoming_score = tag.score or 0.0
         if incoming_score > existing_score:
-            deduped[normalized_value] = Tag(
+            deduped[normalized_value] = Tag.model_construct(
                 value=normalized_value,
                 score=tag.score,
                 source=tag.source,
@@ -104,7 +104,7 @@ def merge_tags_for_images(
                 if score > score_map.get(tag.value, 0.0):
                     score_map[tag.value] = score
         merged_tags = [
-            Tag(
+            Tag.model_construct(
                 value=value,
                 score=score_map.get(value, 0.0),
                 source="clip",
@@ -177,7 +177,7 @@ def build_tag_stat_models(
     tag_stats: dict[str, TagStats],
 ) -> list[TagStat]:
     return [
-        TagStat(
+        TagStat.model_construct(
             tag=tag,
             count=stats.count,
             mean_score=stats.mean_score,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
+from functools import lru_cache
 
 from ...config import get_settings
 from ...contracts_models import (
@@ -13,6 +14,7 @@ from ...contracts_models import (
     PipelineMeta,
     PipelineModels,
     PipelineTimings,
+    ProductFacts,
     Tag,
 )
 from ..errors import AiServiceError
@@ -42,6 +44,19 @@ def _normalize_brand(value: str) -> str:
     return " ".join(value.strip().lower().split())
 
 
+@lru_cache(maxsize=8)
+def _brand_lookup(brand_list: tuple[str, ...]) -> dict[str, str]:
+    return {
+        _normalize_brand(brand): brand.strip()
+        for brand in brand_list
+        if brand.strip()
+    }
+
+
+def _clip_tag_score(tag: Tag) -> ClipTagScore:
+    return ClipTagScore(tag=tag.value, score=float(tag.score or 0.0))
+
+
 def _detect_brand(
     brand_list: tuple[str, ...],
     tags_strict: list[str],
@@ -51,17 +66,13 @@ def _detect_brand(
 ) -> tuple[str | None, float | None]:
     if not brand_list:
         return None, None
-    normalized_map = {
-        _normalize_brand(brand): brand.strip()
-        for brand in brand_list
-        if brand.strip()
-    }
+    normalized_map = _brand_lookup(brand_list)
     if not normalized_map:
         return None, None
     if strict:
-        tags_source = tags_strict or tags_soft
+        tags_source = set(tags_strict or tags_soft)
     else:
-        tags_source = tags_soft or tags_strict
+        tags_source = set(tags_soft or tags_strict)
     candidates = [
         brand for brand in normalized_map.keys() if brand in tags_source
     ]
@@ -92,7 +103,7 @@ def build_product_facts(
     brand_candidate: str | None,
     brand_confidence: float | None,
     max_tags: int,
-) -> dict[str, object]:
+) -> ProductFacts:
     tags_per_image_scored = [
         [
             {"tag": tag.value, "score": float(tag.score or 0.0)}
@@ -137,7 +148,7 @@ def run_pipeline(payload: AnalyzeProductRequest) -> AnalyzeProductResponse:
     debug_response = settings.DEBUG or (debug_enabled and settings.DEBUG_AI_RESPONSE)
     debug_info: AnalyzeDebug | None = None
     if debug_enabled:
-        debug_info = AnalyzeDebug(llm=LlmDebug())
+        debug_info = AnalyzeDebug.model_construct(llm=LlmDebug.model_construct())
 
     start = time.perf_counter()
     try:
@@ -176,19 +187,19 @@ def run_pipeline(payload: AnalyzeProductRequest) -> AnalyzeProductResponse:
         if debug_info:
             debug_info.clip_tags_per_image = [
                 [
-                    ClipTagScore(tag=tag.value, score=float(tag.score or 0.0))
+                    _clip_tag_score(tag)
                     for tag in tags_for_image[: settings.DEBUG_AI_MAX_TAGS_LOG]
                 ]
                 for tags_for_image in tags_per_image
             ]
             if tags_per_image:
                 debug_info.clip_tags_image_1 = [
-                    ClipTagScore(tag=tag.value, score=float(tag.score or 0.0))
+                    _clip_tag_score(tag)
                     for tag in tags_per_image[0]
                 ]
             if len(tags_per_image) > 1:
                 debug_info.clip_tags_image_2 = [
-                    ClipTagScore(tag=tag.value, score=float(tag.score or 0.0))
+                    _clip_tag_score(tag)
                     for tag in tags_per_image[1]
                 ]
             debug_info.clip_tags_intersection = merged.intersection
@@ -196,7 +207,7 @@ def run_pipeline(payload: AnalyzeProductRequest) -> AnalyzeProductResponse:
             debug_info.tag_merge_fallback = merged.fallback
             sorted_tags = sorted(tags, key=lambda tag: tag.score or 0.0, reverse=True)
             debug_info.clip_tags_top = [
-                ClipTagScore(tag=tag.value, score=float(tag.score or 0.0))
+                _clip_tag_score(tag)
                 for tag in sorted_tags[: settings.DEBUG_AI_MAX_TAGS_LOG]
             ]
             debug_info.tags_strict = tags_strict
@@ -340,15 +351,15 @@ def run_pipeline(payload: AnalyzeProductRequest) -> AnalyzeProductResponse:
 
         total_ms = (time.perf_counter() - start) * 1000
 
-        meta = PipelineMeta(
+        meta = PipelineMeta.model_construct(
             contract_version="1.0",
             device=routing.llm,
-            models=PipelineModels(
+            models=PipelineModels.model_construct(
                 tagger=f"openvino:clip:{settings.OV_CLIP_DIR}",
                 captioner=f"openvino:caption:{settings.OV_CAPTION_DIR}",
                 llm=f"openvino-genai:{settings.OV_LLM_DIR}",
             ),
-            timings=PipelineTimings(
+            timings=PipelineTimings.model_construct(
                 image_load_ms=image_load_ms,
                 tagger_ms=tagger_ms,
                 captioner_ms=captioner_ms,
@@ -357,7 +368,7 @@ def run_pipeline(payload: AnalyzeProductRequest) -> AnalyzeProductResponse:
             ),
         )
 
-        return AnalyzeProductResponse(
+        return AnalyzeProductResponse.model_construct(
             job_id=payload.job_id,
             title=title,
             description=description,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+from ...contracts_models import ProductFacts
+
 
 COPYWRITER_SYSTEM = """You are an e-commerce copywriter.
 Return ONLY valid JSON, no markdown, no extra text.
@@ -15,7 +17,7 @@ If an attribute is not supported by product_facts, do not invent it.
 def build_copy_prompt(
     price_amount: float,
     currency: str,
-    product_facts: dict[str, object],
+    product_facts: ProductFacts,
 ) -> str:
     facts_json = json.dumps(product_facts, ensure_ascii=False, sort_keys=True)
     return f"""
@@ -12,7 +12,7 @@ from transformers import CLIPProcessor
 from ...config import get_settings
 from ...contracts_models import AnalyzeDebug, ClipTagScore, Tag
 from ...model_manager import model_fetch_hint
-from ...ov_runtime import compile_strict, create_core
+from ...ov_runtime import compile_strict, get_core
 from ..errors import AiServiceError
 from .normalize import normalize_tags
 
@@ -69,7 +69,7 @@ class ClipTagger:
         found_files = _list_files(clip_dir)
         image_model_path = clip_dir / "image_encoder.xml"
         text_model_path = clip_dir / "text_encoder.xml"
-        core = create_core(settings.OV_CACHE_DIR)
+        core = get_core(settings.OV_CACHE_DIR)
         self.image_model: ov.CompiledModel | None = None
         self.text_model: ov.CompiledModel | None = None
         self.clip_dir = clip_dir
@@ -0,0 +1,30 @@
+import warnings
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_health_answers_get_and_head():
+    client = TestClient(app)
+
+    assert client.get("/health").json() == {"status": "ok"}
+    head = client.head("/health")
+    assert head.status_code == 200
+    assert head.content == b""
+    assert client.post("/health").status_code == 405
+
+
+def test_openapi_operation_ids_are_unique():
+    app.openapi_schema = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        schema = app.openapi()
+
+    operation_ids = [
+        operation["operationId"]
+        for path in schema["paths"].values()
+        for operation in path.values()
+    ]
+    assert len(operation_ids) == len(set(operation_ids))
+    assert list(schema["paths"]["/health"]) == ["get"]
@@ -0,0 +1,464 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app import model_manager
+from app.services.errors import AiServiceError
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+def _age(*paths):
+    # Asset caches only keep results for directories that have settled.
+    for path in paths:
+        os.utime(path, ns=(0, 1_000_000_000))
+
+
+def test_find_ir_dir_prefers_shallowest_ir_dir(tmp_path):
+    _touch(tmp_path / "nested" / "deeper" / "model.xml")
+    _touch(tmp_path / "nested" / "deeper" / "model.bin")
+    _touch(tmp_path / "other" / "model.xml")
+
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path / "nested" / "deeper"
+
+    _touch(tmp_path / "model.xml")
+    _touch(tmp_path / "model.bin")
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path
+
+
+def test_find_ir_dir_cache_is_invalidated(tmp_path, monkeypatch):
+    _touch(tmp_path / "ir" / "model.xml")
+    _touch(tmp_path / "ir" / "model.bin")
+    _age(tmp_path, tmp_path / "ir")
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path / "ir"
+
+    calls = []
+    original_scan = model_manager._scan_ir_dir
+    monkeypatch.setattr(
+        model_manager,
+        "_scan_ir_dir",
+        lambda target_dir: calls.append(target_dir) or original_scan(target_dir),
+    )
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path / "ir"
+    assert calls == []
+
+    model_manager._invalidate_asset_caches(tmp_path)
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path / "ir"
+    assert calls == [tmp_path]
+
+
+def test_find_ir_dir_sees_changes_inside_existing_subdirs(tmp_path):
+    (tmp_path / "ir").mkdir()
+    _touch(tmp_path / "ir" / "model.xml")
+    assert model_manager._find_ir_dir(tmp_path) is None
+
+    _touch(tmp_path / "ir" / "model.bin")
+    assert model_manager._find_ir_dir(tmp_path) == tmp_path / "ir"
+
+    target_mtime = tmp_path.stat().st_mtime_ns
+    (tmp_path / "ir" / "model.bin").unlink()
+    # Pin the subdir mtime so the change is visible at any timestamp resolution.
+    os.utime(tmp_path / "ir", ns=(0, 0))
+    assert tmp_path.stat().st_mtime_ns == target_mtime
+    assert model_manager._find_ir_dir(tmp_path) is None
+
+
+def test_find_ir_dir_skips_dot_dirs(tmp_path):
+    _touch(tmp_path / ".cache" / "model.xml")
+    _touch(tmp_path / ".cache" / "model.bin")
+
+    assert model_manager._find_ir_dir(tmp_path) is None
+
+
+def test_list_files_returns_sorted_file_names(tmp_path):
+    _touch(tmp_path / "b.bin")
+    _touch(tmp_path / "a.xml")
+    (tmp_path / "subdir").mkdir()
+
+    assert model_manager._list_files(tmp_path) == ["a.xml", "b.bin"]
+    assert model_manager._list_files(tmp_path / "missing") == []
+    assert model_manager._list_files(tmp_path / "a.xml") == []
+
+
+def test_build_model_specs_returns_fresh_specs(tmp_path):
+    def settings(llm_source):
+        return SimpleNamespace(
+            CLIP_SOURCE="hf_export",
+            OV_CLIP_DIR=str(tmp_path / "clip"),
+            CAPTION_HF_ID="caption-id",
+            OV_CAPTION_DIR=str(tmp_path / "caption"),
+            LLM_SOURCE=llm_source,
+            LLM_HF_OV_REPO="llm-ov-repo",
+            LLM_HF_ID="llm-id",
+            OV_LLM_DIR=str(tmp_path / "llm"),
+        )
+
+    specs = model_manager.build_model_specs(settings("prebuilt_ov_ir"))
+    specs["llm"].actual_dir = tmp_path / "llm" / "stale"
+
+    assert not (tmp_path / "clip").exists()
+    again = model_manager.build_model_specs(settings("prebuilt_ov_ir"))
+    assert again["llm"] is not specs["llm"]
+    assert again["llm"].actual_dir is None
+    hf_specs = model_manager.build_model_specs(settings("hf_export"))
+    assert hf_specs["llm"].source_kind == "hf_export"
+    assert specs["llm"].source_kind == "hf_snapshot"
+
+
+def _spec(name, target_dir, required_files):
+    return model_manager.ModelSpec(
+        name=name,
+        source_kind="hf_export",
+        hf_id=f"{name}-id",
+        target_dir=target_dir,
+        required_files=required_files,
+    )
+
+
+def test_check_assets_caption_uses_target_dir_fallback(tmp_path):
+    spec = _spec(
+        "caption",
+        tmp_path,
+        (
+            "vision_encoder.xml",
+            "vision_encoder.bin",
+            "text_decoder.xml",
+            "text_decoder.bin",
+        ),
+    )
+    for name in spec.required_files:
+        _touch(tmp_path / "ir" / name)
+    _touch(tmp_path / "ir" / "preprocessor_config.json")
+
+    status = model_manager.check_assets(spec)
+    assert status.checked_dir == tmp_path / "ir"
+    assert status.missing == []
+
+    (tmp_path / "ir" / "text_decoder.bin").unlink()
+    _touch(tmp_path / "text_decoder.bin")
+    assert model_manager.check_assets(spec).missing == []
+
+    (tmp_path / "ir" / "preprocessor_config.json").unlink()
+    status = model_manager.check_assets(spec)
+    assert str(tmp_path / "ir" / "preprocessor_config.json") in status.missing
+
+
+def test_run_with_output_tails_keeps_only_the_tail():
+    script = (
+        "import sys\n"
+        "sys.stdout.write('x' * 10000 + 'END')\n"
+        "sys.stderr.write('boom')\n"
+        "sys.exit(3)\n"
+    )
+    returncode, stdout_tail, stderr_tail = model_manager._run_with_output_tails(
+        [sys.executable, "-c", script], env=dict(os.environ), limit=100
+    )
+
+    assert returncode == 3
+    assert stdout_tail == "x" * 97 + "END"
+    assert stderr_tail == "boom"
+
+
+@pytest.mark.parametrize("resync_in_place", [False, True])
+def test_force_resync_of_complete_snapshot_is_opt_in(
+    tmp_path, monkeypatch, resync_in_place
+):
+    llm_dir = tmp_path / "llm"
+    spec = model_manager.ModelSpec(
+        name="llm",
+        source_kind="hf_snapshot",
+        hf_id="llm-ov-repo",
+        target_dir=llm_dir,
+        required_files=(),
+    )
+    for name in ("openvino_model.xml", "openvino_model.bin", "tokenizer.json"):
+        _touch(llm_dir / name)
+    _touch(llm_dir / "config.json")
+    weights_kept = []
+
+    def fake_conversion(spec, settings, offline, env):
+        weights_kept.append((llm_dir / "openvino_model.bin").exists())
+        for name in ("openvino_model.xml", "openvino_model.bin", "tokenizer.json"):
+            _touch(llm_dir / name)
+        _touch(llm_dir / "config.json")
+        return "ok", None
+
+    monkeypatch.setattr(model_manager, "build_model_specs", lambda _: {"llm": spec})
+    monkeypatch.setattr(model_manager, "_run_conversion", fake_conversion)
+
+    model_manager.ensure_models(
+        mode="force",
+        offline=False,
+        settings=SimpleNamespace(
+            MODEL_DIR=str(tmp_path),
+            MODEL_FORCE_RESYNC_IN_PLACE=resync_in_place,
+            MODEL_PREPARE_WORKERS=1,
+        ),
+    )
+
+    assert weights_kept == [resync_in_place]
+
+
+@pytest.mark.parametrize(
+    ("workers", "expected_converted"),
+    [(1, ["first"]), (2, ["first", "second"])],
+)
+def test_ensure_models_prepare_workers(
+    tmp_path, monkeypatch, workers, expected_converted
+):
+    specs = {
+        name: model_manager.ModelSpec(
+            name=name,
+            source_kind="hf_export",
+            hf_id=f"{name}-id",
+            target_dir=tmp_path / name,
+            required_files=("model.xml", "model.bin"),
+        )
+        for name in ("first", "second")
+    }
+    converted = []
+
+    def fake_conversion(spec, settings, offline, env):
+        converted.append(spec.name)
+        if spec.name == "second":
+            _touch(spec.target_dir / "model.xml")
+            _touch(spec.target_dir / "model.bin")
+        return None, None
+
+    monkeypatch.setattr(model_manager, "build_model_specs", lambda _: specs)
+    monkeypatch.setattr(model_manager, "_run_conversion", fake_conversion)
+
+    with pytest.raises(AiServiceError) as excinfo:
+        model_manager.ensure_models(
+            mode="download",
+            offline=False,
+            settings=SimpleNamespace(
+                MODEL_DIR=str(tmp_path), MODEL_PREPARE_WORKERS=workers
+            ),
+        )
+
+    # Serial preparation stops at the first failure; parallel preparation
+    # runs every pending spec and re-raises failures in spec order.
+    assert sorted(converted) == expected_converted
+    assert excinfo.value.details["model"] == "first"
+
+
+def test_check_assets_llm_accepts_tokenizer_and_config_in_target_dir(tmp_path):
+    spec = _spec("llm", tmp_path, ("openvino_model.xml", "openvino_model.bin"))
+    _touch(tmp_path / "ov" / "openvino_model.xml")
+    _touch(tmp_path / "ov" / "openvino_model.bin")
+    _touch(tmp_path / "tokenizer.model")
+
+    status = model_manager.check_assets(spec)
+    assert status.missing == [str(tmp_path / "ov" / "config.json")]
+    assert status.details == {"tokenizer_ir_missing": True}
+
+    _touch(tmp_path / "config.json")
+    assert model_manager.check_assets(spec).missing == []
+
+
+@pytest.mark.parametrize("mode", ["never", "download"])
+def test_ensure_models_checks_ready_models_under_a_shared_lock(
+    tmp_path, monkeypatch, mode
+):
+    spec = _spec("clip", tmp_path / "clip", ("model.xml", "model.bin"))
+    _touch(spec.target_dir / "model.xml")
+    _touch(spec.target_dir / "model.bin")
+    monkeypatch.setattr(model_manager, "build_model_specs", lambda _: {"clip": spec})
+    locks = []
+    original_lock = model_manager._model_lock
+
+    def recording_lock(lock_path, shared=False, blocking=True):
+        locks.append((shared, blocking))
+        return original_lock(lock_path, shared=shared, blocking=blocking)
+
+    monkeypatch.setattr(model_manager, "_model_lock", recording_lock)
+
+    model_manager.ensure_models(
+        mode=mode,
+        offline=False,
+        settings=SimpleNamespace(MODEL_DIR=str(tmp_path)),
+    )
+
+    assert locks == [(True, mode != "never")]
+
+
+@pytest.mark.skipif(model_manager.fcntl is None, reason="flock is POSIX-only")
+def test_ensure_models_never_mode_fails_fast_while_models_are_prepared(
+    tmp_path, monkeypatch
+):
+    spec = _spec("clip", tmp_path / "clip", ("model.xml", "model.bin"))
+    _touch(spec.target_dir / "model.xml")
+    _touch(spec.target_dir / "model.bin")
+    monkeypatch.setattr(model_manager, "build_model_specs", lambda _: {"clip": spec})
+    settings = SimpleNamespace(MODEL_DIR=str(tmp_path))
+
+    with model_manager._model_lock(tmp_path / ".lock"):
+        with pytest.raises(AiServiceError) as excinfo:
+            model_manager.ensure_models(mode="never", offline=False, settings=settings)
+    assert excinfo.value.code == "MODEL_NOT_AVAILABLE"
+
+    with model_manager._model_lock(tmp_path / ".lock", shared=True):
+        model_manager.ensure_models(mode="never", offline=False, settings=settings)
+
+
+def test_ensure_models_never_mode_skips_the_lock_without_flock(
+    tmp_path, monkeypatch
+):
+    from filelock import FileLock
+
+    spec = _spec("clip", tmp_path / "clip", ("model.xml", "model.bin"))
+    _touch(spec.target_dir / "model.xml")
+    _touch(spec.target_dir / "model.bin")
+    monkeypatch.setattr(model_manager, "build_model_specs", lambda _: {"clip": spec})
+    monkeypatch.setattr(model_manager, "fcntl", None)
+
+    with FileLock(str(tmp_path / ".lock"), timeout=0):
+        model_manager.ensure_models(
+            mode="never",
+            offline=False,
+            settings=SimpleNamespace(MODEL_DIR=str(tmp_path)),
+        )
+
+
+def test_check_assets_caches_settled_directories_until_they_change(tmp_path, monkeypatch):
+    spec = _spec("clip", tmp_path, ("model.xml", "model.bin"))
+    _touch(tmp_path / "model.xml")
+    calls = []
+    original_check = model_manager._check_assets
+    monkeypatch.setattr(
+        model_manager,
+        "_check_assets",
+        lambda spec, checked_dir, *listings: calls.append(checked_dir)
+        or original_check(spec, checked_dir, *listings),
+    )
+
+    first = model_manager.check_assets(spec)
+    assert model_manager.check_assets(spec) is not first
+    assert len(calls) == 2
+
+    _age(tmp_path)
+    first = model_manager.check_assets(spec)
+    first.missing.append("mutated")
+    again = model_manager.check_assets(spec)
+    assert again.missing == [str(tmp_path / "model.bin")]
+    assert again.found_files is not first.found_files
+    assert len(calls) == 3
+
+    _touch(tmp_path / "model.bin")
+    assert model_manager.check_assets(spec).missing == []
+    assert len(calls) == 4
+
+
+def test_check_assets_reports_everything_missing_without_target_dir(
+    tmp_path, monkeypatch
+):
+    spec = _spec("clip", tmp_path / "absent", ("model.xml", "model.bin"))
+    monkeypatch.setattr(
+        model_manager,
+        "_list_files",
+        lambda directory: pytest.fail(f"listed {directory}"),
+    )
+
+    status = model_manager.check_assets(spec)
+
+    assert status.found_files == []
+    assert status.missing == [
+        str(tmp_path / "absent" / "model.xml"),
+        str(tmp_path / "absent" / "model.bin"),
+    ]
+
+
+@pytest.mark.skipif(model_manager.fcntl is None, reason="flock is POSIX-only")
+def test_model_lock_excludes_other_holders(tmp_path):
+    import fcntl
+
+    lock_path = tmp_path / "models" / ".lock"
+    with model_manager._model_lock(lock_path):
+        fd = os.open(lock_path, os.O_RDWR)
+        try:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        finally:
+            os.close(fd)
+
+    fd = os.open(lock_path, os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    finally:
+        os.close(fd)
+
+
+def test_write_manifest_replaces_the_file_atomically(tmp_path):
+    (tmp_path / "manifest.json").write_text("stale", encoding="utf-8")
+
+    model_manager._write_manifest(tmp_path, [_spec("clip", tmp_path / "clip", ("a",))])
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["ready"] is True
+    assert [model["name"] for model in manifest["models"]] == ["clip"]
+    assert list(tmp_path.glob(".manifest.json.*")) == []
+
+
+def test_conversion_env_keeps_existing_values(tmp_path, monkeypatch):
+    monkeypatch.setenv("HF_HOME", "/custom/hf")
+    monkeypatch.delenv("HF_HUB_OFFLINE", raising=False)
+    settings = SimpleNamespace(MODEL_DIR=str(tmp_path))
+
+    env = model_manager._conversion_env(settings, offline=True)
+
+    assert env["HF_HOME"] == "/custom/hf"
+    assert env["HUGGINGFACE_HUB_CACHE"] == str(tmp_path / ".hf_cache")
+    assert env["HF_HUB_OFFLINE"] == "1"
+    assert "HF_HUB_OFFLINE" not in model_manager._conversion_env(settings, offline=False)
+
+
+def test_write_manifest_keeps_an_unchanged_manifest(tmp_path):
+    specs = [_spec("clip", tmp_path / "clip", ("a",))]
+    model_manager._write_manifest(tmp_path, specs)
+    manifest_path = tmp_path / "manifest.json"
+    first = manifest_path.read_text(encoding="utf-8")
+    os.utime(manifest_path, ns=(0, 0))
+
+    model_manager._write_manifest(tmp_path, specs)
+    assert manifest_path.stat().st_mtime_ns == 0
+
+    model_manager._write_manifest(tmp_path, specs, refresh=True)
+    assert manifest_path.stat().st_mtime_ns != 0
+
+    os.utime(manifest_path, ns=(0, 0))
+    model_manager._write_manifest(tmp_path, [_spec("clip", tmp_path / "clip", ("b",))])
+    assert manifest_path.stat().st_mtime_ns != 0
+    assert manifest_path.read_text(encoding="utf-8") != first
+
+
+def test_run_with_output_tails_survives_undecodable_output():
+    script = "import sys\nsys.stdout.buffer.write(b'\\xff\\xfe ok')\n"
+    returncode, stdout_tail, _ = model_manager._run_with_output_tails(
+        [sys.executable, "-c", script], env=dict(os.environ)
+    )
+
+    assert returncode == 0
+    assert stdout_tail.endswith(" ok")
+
+
+def test_run_with_output_tails_kills_a_hung_converter():
+    script = (
+        "import sys, time\n"
+        "sys.stderr.write('working')\n"
+        "sys.stderr.flush()\n"
+        "time.sleep(30)\n"
+    )
+    returncode, _, stderr_tail = model_manager._run_with_output_tails(
+        [sys.executable, "-c", script], env=dict(os.environ), timeout=1
+    )
+
+    assert returncode != 0
+    assert stderr_tail.startswith("working")
+    assert "Timed out after 1s" in stderr_tail
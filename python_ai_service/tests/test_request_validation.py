@@ -15,3 +15,78 @@ def test_request_requires_positive_price():
             price=Money(amount=0),
             images=[ImageRef(kind="path", value="image.jpg")],
         )
+
+
+def test_analyze_endpoint_reports_body_validation_errors():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    response = TestClient(app).post(
+        "/analyze-product",
+        json={"jobId": 1, "price": {"amount": 0}, "images": []},
+    )
+
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert ["body", "price", "amount"] in locs
+    assert ["body", "images"] in locs
+
+
+def test_analyze_endpoint_reports_job_id_on_unexpected_failure(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app import main
+
+    def fail(payload):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(main, "analyze", fail)
+    response = TestClient(main.app).post(
+        "/analyze-product",
+        json={
+            "jobId": 7,
+            "price": {"amount": 10},
+            "images": [{"kind": "path", "value": "image.jpg"}],
+        },
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {
+        "code": "INFERENCE_FAILED",
+        "message": "Unexpected inference error.",
+        "details": {"error": "boom"},
+        "jobId": 7,
+    }
+
+
+@pytest.mark.parametrize(
+    ("content", "headers"),
+    [
+        ('{"jobId": 1}', {"content-type": "text/plain"}),
+        ('{"jobId": 1}', {}),
+        ("", {"content-type": "application/json"}),
+        ("{", {"content-type": "application/json"}),
+    ],
+)
+def test_analyze_endpoint_matches_stock_body_errors(content, headers):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    stock = FastAPI()
+
+    @stock.post("/analyze-product")
+    async def analyze_product(payload: AnalyzeProductRequest):
+        return {}
+
+    expected = TestClient(stock).post(
+        "/analyze-product", content=content, headers=headers
+    )
+    response = TestClient(app).post(
+        "/analyze-product", content=content, headers=headers
+    )
+
+    assert response.status_code == expected.status_code == 422
+    assert response.json() == expected.json()